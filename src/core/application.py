@@ -3,15 +3,26 @@ Main application class for Serenade WhisperAI.
 """
 
 import asyncio
+import os
 import sys
-from typing import Optional
+from typing import Optional, List, Tuple, TYPE_CHECKING
 from loguru import logger
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 from .config import Config
-from .audio.audio_manager import AudioManager
-from .speech.whisper_engine import WhisperEngine
-from .commands.command_processor import CommandProcessor
-from .automation.automation_manager import AutomationManager
+
+# Components pull in torch, whisper and device libraries; they are imported
+# in initialize_components so importing this module (and running system
+# checks or --help) stays cheap. No heavyweight imports at module level.
+if TYPE_CHECKING:
+    from .audio.audio_manager import AudioManager
+    from .speech.whisper_engine import WhisperEngine, AudioInput
+    from .commands.command_processor import CommandProcessor
+    from .automation.automation_manager import AutomationManager
 
 
 class Application:
@@ -30,25 +41,45 @@ class Application:
         self.server_only = server_only
         
         # Core components
-        self.audio_manager: Optional[AudioManager] = None
-        self.whisper_engine: Optional[WhisperEngine] = None
-        self.command_processor: Optional[CommandProcessor] = None
-        self.automation_manager: Optional[AutomationManager] = None
+        self.audio_manager: Optional["AudioManager"] = None
+        self.whisper_engine: Optional["WhisperEngine"] = None
+        self.command_processor: Optional["CommandProcessor"] = None
+        self.automation_manager: Optional["AutomationManager"] = None
         self.gui = None
         self.server = None
         
         # State
         self.running = False
         self.loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Transcription batching
+        config.bind(self, {
+            "batch_size": "whisper.batch_size",
+            "batch_buckets": "whisper.batch_buckets"
+        })
+        self._audio_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
     
     def initialize_components(self):
         """Initialize all application components."""
         logger.info("Initializing core components...")
         
+        # Reuse the caller's loop when initialized from async code
+        try:
+            self.loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.loop = None
+        
         try:
+            from .audio.audio_manager import AudioManager
+            from .speech.whisper_engine import WhisperEngine
+            from .commands.command_processor import CommandProcessor
+            from .automation.automation_manager import AutomationManager
+            
             # Initialize Whisper engine
             logger.info("Loading Whisper model...")
             self.whisper_engine = WhisperEngine(self.config)
+            self.whisper_engine.warmup()
             logger.success("Whisper engine initialized")
             
             # Initialize audio manager
@@ -72,6 +103,11 @@ class Application:
             # Initialize GUI if not headless
             if not self.headless and not self.server_only:
                 logger.info("Initializing GUI...")
+                
+                # No display on CI runners; skip X11/Wayland initialization
+                if os.environ.get("CI"):
+                    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+                
                 from gui.main_window import MainWindow
                 from PyQt6.QtWidgets import QApplication
                 
@@ -100,7 +136,7 @@ class Application:
             logger.success("All components initialized successfully")
             
         except Exception as e:
-            logger.exception(f"Failed to initialize components: {e}")
+            logger.exception("Failed to initialize components: {}", e)
             raise
     
     def setup_callbacks(self):
@@ -119,46 +155,144 @@ class Application:
         
         logger.success("Callbacks configured")
     
-    async def _handle_audio_ready(self, audio_data: bytes):
-        """Handle audio data from audio manager."""
-        logger.debug("Audio data received, starting transcription...")
+    async def _handle_audio_ready(self, audio_data: "AudioInput"):
+        """Handle audio data from audio manager.
+        
+        Raw PCM buffers (``np.ndarray`` or ``memoryview``) are passed
+        through to the engine untouched, so no WAV encode/decode or extra
+        copy happens on the capture path.
+        """
+        logger.debug("Audio data received, queueing for transcription...")
+        
+        loop = asyncio.get_running_loop()
         
         try:
-            transcription = await self.whisper_engine.transcribe_async(audio_data)
-            logger.info(f"Transcription: {transcription}")
+            # Bucket here so an unreadable clip fails its own request
+            # instead of the shared batch worker
+            index = self._bucket_index(self.whisper_engine.audio_duration(audio_data))
+            
+            if self._batch_task is None or self._batch_task.done():
+                self._audio_queue = asyncio.Queue()
+                self._batch_task = loop.create_task(self._batch_worker())
+            
+            future = loop.create_future()
+            await self._audio_queue.put((audio_data, index, future))
+            
+            transcription = await future
+            logger.info("Transcription: {}", transcription)
             
             if self.gui:
                 self.gui.update_transcription(transcription)
             
         except Exception as e:
-            logger.error(f"Transcription failed: {e}")
+            logger.error("Transcription failed: {}", e)
+    
+    async def _batch_worker(self):
+        """Coalesce queued audio into duration-bucketed batches.
+        
+        Each utterance goes into the first bucket whose duration bound
+        covers it (longer clips share the last bucket), so a batch never
+        pads a short clip out to a much longer one. A bucket is flushed
+        once it holds ``batch_size`` items or its oldest item has waited
+        for that bucket's timeout.
+        
+        If the worker stops for any reason, every request it still holds
+        is failed with the same error rather than left waiting forever.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._audio_queue
+        buckets: List[List[Tuple["AudioInput", asyncio.Future, float]]] = [
+            [] for _ in self.batch_buckets
+        ]
+        batch: List[Tuple["AudioInput", asyncio.Future, float]] = []
+        
+        try:
+            while True:
+                # Sleep until the next item arrives or the earliest bucket expires
+                deadlines = [
+                    pending[0][2] + max_wait
+                    for pending, (_, max_wait) in zip(buckets, self.batch_buckets)
+                    if pending
+                ]
+                timeout = max(0.0, min(deadlines) - loop.time()) if deadlines else None
+                
+                try:
+                    audio_data, index, future = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                else:
+                    buckets[index].append((audio_data, future, loop.time()))
+                
+                now = loop.time()
+                for pending, (_, max_wait) in zip(buckets, self.batch_buckets):
+                    while pending and (len(pending) >= self.batch_size or now - pending[0][2] >= max_wait):
+                        batch = pending[:self.batch_size]
+                        del pending[:self.batch_size]
+                        await self._transcribe_batch(batch)
+                        batch = []
+        except BaseException as e:
+            futures = [future for pending in buckets + [batch] for _, future, _ in pending]
+            while not queue.empty():
+                futures.append(queue.get_nowait()[2])
+            
+            for future in futures:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            raise
+    
+    def _bucket_index(self, duration: float) -> int:
+        """Index of the first batch bucket whose duration bound fits."""
+        for index, (max_duration, _) in enumerate(self.batch_buckets):
+            if duration <= max_duration:
+                return index
+        return len(self.batch_buckets) - 1
+    
+    async def _transcribe_batch(self, batch: List[Tuple["AudioInput", asyncio.Future, float]]):
+        """Transcribe one batch and resolve each request's future."""
+        logger.debug("Transcribing batch of {} utterance(s)", len(batch))
+        
+        try:
+            texts = await self.whisper_engine.transcribe_batch([audio for audio, _, _ in batch])
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future, _), text in zip(batch, texts):
+            if not future.done():
+                future.set_result(text)
     
     async def _handle_transcription(self, transcription: str, confidence: float):
         """Handle transcription from Whisper engine."""
-        logger.info(f"Processing transcription: '{transcription}' (confidence: {confidence:.2f})")
+        logger.info("Processing transcription: '{}' (confidence: {:.2f})", transcription, confidence)
         
         try:
             # Process command
             result = await self.command_processor.process_command(transcription)
             
             if result.success:
-                logger.success(f"Command executed: {result.command}")
+                logger.success("Command executed: {}", result.command)
             else:
-                logger.warning(f"Command failed: {result.error}")
+                logger.warning("Command failed: {}", result.error)
             
         except Exception as e:
-            logger.error(f"Command processing failed: {e}")
+            logger.error("Command processing failed: {}", e)
     
     async def _handle_command_executed(self, command: str, result: dict):
         """Handle successful command execution."""
-        logger.debug(f"Command '{command}' executed successfully")
+        logger.debug("Command '{}' executed successfully", command)
         
         if self.gui:
             self.gui.show_success_notification(command)
     
     async def _handle_command_error(self, command: str, error: str):
         """Handle command execution error."""
-        logger.warning(f"Command '{command}' failed: {error}")
+        logger.warning("Command '{}' failed: {}", command, error)
         
         if self.gui:
             self.gui.show_error_notification(error)
@@ -191,7 +325,7 @@ class Application:
             logger.info("Shutdown requested")
             return 0
         except Exception as e:
-            logger.exception(f"Application error: {e}")
+            logger.exception("Application error: {}", e)
             return 1
         finally:
             self.cleanup()
@@ -204,7 +338,7 @@ class Application:
             self.gui.show()
             return self.qt_app.exec()
         except Exception as e:
-            logger.exception(f"GUI error: {e}")
+            logger.exception("GUI error: {}", e)
             return 1
     
     def _run_headless_mode(self) -> int:
@@ -212,9 +346,10 @@ class Application:
         logger.info("Running in headless mode")
         
         try:
-            # Create event loop
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
+            # Create event loop (libuv-based when uvloop is installed)
+            if self.loop is None:
+                self.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+                asyncio.set_event_loop(self.loop)
             
             # Start audio capture
             self.audio_manager.start()
@@ -228,10 +363,16 @@ class Application:
             logger.info("Shutdown requested")
             return 0
         except Exception as e:
-            logger.exception(f"Headless mode error: {e}")
+            logger.exception("Headless mode error: {}", e)
             return 1
         finally:
             if self.loop:
+                # Cancel the batch worker while its loop can still run it
+                if self._batch_task and not self._batch_task.done():
+                    self._batch_task.cancel()
+                    self.loop.run_until_complete(
+                        asyncio.gather(self._batch_task, return_exceptions=True)
+                    )
                 self.loop.close()
     
     def _run_server_mode(self) -> int:
@@ -248,13 +389,17 @@ class Application:
                 self.server.app,
                 host=host,
                 port=port,
+                # One process shares the loaded model; extra workers
+                # would each load their own multi-GB copy
+                workers=1,
+                loop="uvloop" if uvloop else "asyncio",
                 log_level="info"
             )
             
             return 0
             
         except Exception as e:
-            logger.exception(f"Server error: {e}")
+            logger.exception("Server error: {}", e)
             return 1
     
     def cleanup(self):
@@ -264,16 +409,37 @@ class Application:
         self.running = False
         
         try:
-            if self.audio_manager:
-                self.audio_manager.stop()
-            
-            if self.whisper_engine:
-                self.whisper_engine.cleanup()
+            # A task on a closed loop can no longer be cancelled
+            if self._batch_task and not self._batch_task.get_loop().is_closed():
+                self._batch_task.cancel()
             
-            if self.automation_manager:
-                self.automation_manager.cleanup()
+            # The headless loop is already closed here, so use a fresh one
+            asyncio.run(self._shutdown_components())
             
             logger.info("Cleanup complete")
             
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: {}", e)
+    
+    async def _shutdown_components(self):
+        """Stop audio capture, then the remaining components concurrently.
+        
+        Shutdown calls block on device closes and thread joins, so each runs
+        in the executor. Capture stops first so no new audio reaches the
+        engine while it releases its model and executor.
+        """
+        stages = [
+            [self.audio_manager.stop] if self.audio_manager else [],
+            [component.cleanup for component in (self.whisper_engine, self.automation_manager) if component]
+        ]
+        
+        loop = asyncio.get_running_loop()
+        for shutdowns in stages:
+            results = await asyncio.gather(
+                *(loop.run_in_executor(None, shutdown) for shutdown in shutdowns),
+                return_exceptions=True
+            )
+            
+            for shutdown, result in zip(shutdowns, results):
+                if isinstance(result, Exception):
+                    logger.error("Error during cleanup ({}): {}", shutdown.__qualname__, result)
@@ -3,14 +3,22 @@ Command parsing logic.
 """
 
 import re
+import sys
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 from loguru import logger
 
+# dataclass(slots=True) needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class ParsedCommand:
-    """Parsed command data."""
+    """Parsed command data.
+    
+    Frozen because parse results are cached and shared between calls.
+    """
     action: str
     target: Optional[str] = None
     value: Optional[str] = None
@@ -100,53 +108,80 @@ class CommandParser:
         """Initialize parser."""
         self.config = config
         
-        # Compile patterns
-        self.compiled_patterns = []
-        for pattern, (action, param_type) in self.PATTERNS.items():
-            self.compiled_patterns.append((
-                re.compile(pattern, re.IGNORECASE),
-                action,
-                param_type
-            ))
+        # Compile all patterns into one alternation so a single C-level
+        # match finds the first command that applies. Each pattern is
+        # wrapped in a named group; _branches maps that group's index to
+        # its action and parameter type, and the pattern's own captures
+        # follow directly after it.
+        alternatives = []
+        self._branches = {}
+        group_index = 0
+        for i, (pattern, (action, param_type)) in enumerate(self.PATTERNS.items()):
+            alternatives.append(f"(?P<cmd_{i}>{pattern})")
+            group_index += 1
+            self._branches[group_index] = (action, param_type)
+            group_index += re.compile(pattern).groups
+        
+        # Patterns are lowercase and parse() receives lowercased text, so
+        # case-insensitive matching would only add case-folding work
+        self._command_regex = re.compile("|".join(alternatives))
         
-        logger.info(f"CommandParser initialized with {len(self.compiled_patterns)} patterns")
+        # Every pattern starts with a literal word; most non-command speech
+        # can be rejected on that prefix without running the regex
+        self._prefixes = tuple(sorted({
+            re.match(r"[a-z]+", pattern).group(0) for pattern in self.PATTERNS
+        }))
+        
+        # Voice commands repeat a lot; memoize parses per normalized text
+        cache_size = config.get("commands.parse_cache_size", 512)
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse)
+        
+        logger.info("CommandParser initialized with {} patterns", len(self.PATTERNS))
     
     def parse(self, text: str) -> Optional[ParsedCommand]:
         """Parse text into command.
         
         Args:
-            text: Input text
+            text: Input text, already stripped and lowercased by the caller
             
         Returns:
             Parsed command or None
         """
-        text = text.strip().lower()
+        if not text.startswith(self._prefixes):
+            logger.warning("No pattern matched: {}", text)
+            return None
+        
+        return self._parse_cached(text)
+    
+    def _parse(self, text: str) -> Optional[ParsedCommand]:
+        """Match normalized text against the command patterns."""
+        match = self._command_regex.match(text)
         
-        for pattern, action, param_type in self.compiled_patterns:
-            match = pattern.match(text)
+        if match:
+            offset = match.lastindex
+            action, param_type = self._branches[offset]
+            fields = {}
+            
+            if param_type == 'target':
+                fields['target'] = match.group(offset + 1)
+            
+            elif param_type == 'value':
+                fields['value'] = match.group(offset + 1)
             
-            if match:
-                command = ParsedCommand(action=action)
-                
-                if param_type == 'target' and match.groups():
-                    command.target = match.group(1)
-                
-                elif param_type == 'value' and match.groups():
-                    command.value = match.group(1)
-                
-                elif param_type == 'line_number' and match.groups():
-                    try:
-                        command.line_number = int(match.group(1))
-                    except ValueError:
-                        logger.warning(f"Invalid line number: {match.group(1)}")
-                        return None
-                
-                elif param_type == 'target_value' and len(match.groups()) >= 2:
-                    command.target = match.group(1)
-                    command.value = match.group(2)
-                
-                logger.debug(f"Parsed: {text} -> action={command.action}")
-                return command
-        
-        logger.warning(f"No pattern matched: {text}")
+            elif param_type == 'line_number':
+                try:
+                    fields['line_number'] = int(match.group(offset + 1))
+                except ValueError:
+                    logger.warning("Invalid line number: {}", match.group(offset + 1))
+                    return None
+            
+            elif param_type == 'target_value':
+                fields['target'] = match.group(offset + 1)
+                fields['value'] = match.group(offset + 2)
+            
+            command = ParsedCommand(action=action, **fields)
+            logger.debug("Parsed: {} -> action={}", text, command.action)
+            return command
+        
+        logger.warning("No pattern matched: {}", text)
         return None
@@ -2,16 +2,19 @@
 Command processing and execution.
 """
 
+import asyncio
 import re
+import time
+from collections import OrderedDict
 from typing import Optional, Callable
 from dataclasses import dataclass
 from loguru import logger
 
-from .command_parser import CommandParser
+from .command_parser import CommandParser, _SLOTS
 from .command_executor import CommandExecutor
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CommandResult:
     """Command execution result."""
     success: bool
@@ -24,6 +27,17 @@ class CommandResult:
 class CommandProcessor:
     """Process and execute voice commands."""
     
+    # Actions that leave the editor in the same state when repeated, so a
+    # duplicate transcription inside the dedupe window can be dropped
+    IDEMPOTENT_ACTIONS = frozenset({
+        'goto_line', 'goto_function', 'goto_class', 'goto_method',
+        'select_line', 'select_function', 'select_class', 'select_all',
+        'save', 'format_document'
+    })
+    
+    # Maximum number of recent results kept for deduplication
+    DEDUPE_SIZE = 64
+    
     def __init__(self, config, automation_manager):
         """Initialize command processor.
         
@@ -45,6 +59,10 @@ class CommandProcessor:
         # State
         self.last_command: Optional[str] = None
         
+        # Recent idempotent results: transcription -> (timestamp, result)
+        config.bind(self, {"dedupe_window": "commands.dedupe_window"})
+        self._dedupe: OrderedDict = OrderedDict()
+        
         logger.info("CommandProcessor initialized")
     
     async def process_command(self, transcription: str) -> CommandResult:
@@ -57,7 +75,7 @@ class CommandProcessor:
             Command result
         """
         try:
-            # Clean transcription
+            # Clean transcription (the parser expects normalized text)
             transcription = transcription.strip().lower()
             
             if not transcription:
@@ -67,13 +85,21 @@ class CommandProcessor:
                     error="Empty transcription"
                 )
             
-            logger.info(f"Processing command: '{transcription}'")
+            # Collapse repeats of the same idempotent command (e.g. partial
+            # results re-emitting "save file" while the VAD settles)
+            now = time.monotonic()
+            cached = self._dedupe.get(transcription)
+            if cached and now - cached[0] < self.dedupe_window:
+                logger.debug("Skipping duplicate command: '{}'", transcription)
+                return cached[1]
+            
+            logger.info("Processing command: '{}'", transcription)
             
             # Parse command
             parsed = self.parser.parse(transcription)
             
             if not parsed:
-                logger.warning(f"Could not parse command: {transcription}")
+                logger.warning("Could not parse command: {}", transcription)
                 return CommandResult(
                     success=False,
                     command=transcription,
@@ -86,18 +112,36 @@ class CommandProcessor:
             # Store last command
             self.last_command = transcription
             
+            if result.success and parsed.action in self.IDEMPOTENT_ACTIONS:
+                self._dedupe[transcription] = (now, result)
+                self._dedupe.move_to_end(transcription)
+                if len(self._dedupe) > self.DEDUPE_SIZE:
+                    self._dedupe.popitem(last=False)
+            
             # Trigger callbacks
             if result.success and self.on_command_executed:
-                await self.on_command_executed(transcription, result.data or {})
+                await self._dispatch_callback(self.on_command_executed, transcription, result.data or {})
             elif not result.success and self.on_command_error:
-                await self.on_command_error(transcription, result.error or "Unknown error")
+                await self._dispatch_callback(self.on_command_error, transcription, result.error or "Unknown error")
             
             return result
             
         except Exception as e:
-            logger.exception(f"Command processing error: {e}")
+            logger.exception("Command processing error: {}", e)
             return CommandResult(
                 success=False,
                 command=transcription,
                 error=str(e)
             )
+    
+    async def _dispatch_callback(self, callback: Callable, *args):
+        """Invoke a callback without blocking the event loop.
+        
+        Coroutine functions are awaited directly; plain callables are run
+        in the default executor.
+        """
+        if asyncio.iscoroutinefunction(callback):
+            await callback(*args)
+        else:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, callback, *args)
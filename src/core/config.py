@@ -2,11 +2,19 @@
 Configuration management for Serenade WhisperAI.
 """
 
+import copy
+import json
 import yaml
 from pathlib import Path
 from typing import Any, Dict, Optional
 from loguru import logger
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CDumper as Dumper
+except ImportError:
+    from yaml import SafeLoader, Dumper
+
 
 class Config:
     """Configuration manager."""
@@ -22,6 +30,7 @@ class Config:
             "buffer_size": 10
         },
         "whisper": {
+            "backend": "faster_whisper",
             "model": "base",
             "device": "cpu",
             "language": "en",
@@ -29,14 +38,24 @@ class Config:
             "beam_size": 5,
             "best_of": 5,
             "temperature": 0.0,
-            "compute_type": "default"
+            "compute_type": "auto",
+            "compile": True,
+            "cpu_bf16": True,
+            "static_kv_cache": True,
+            "batch_size": 8,
+            "cache_size": 128,
+            "cleanup_empty_cache": False,
+            # [max clip duration (s), max wait before flushing (s)]
+            "batch_buckets": [[3, 0.05], [7, 0.1], [15, 0.25], [30, 0.5]]
         },
         "commands": {
             "confidence_threshold": 0.7,
             "custom_commands_enabled": True,
             "custom_commands_path": "config/custom_commands.yml",
             "command_timeout": 30,
-            "retry_on_failure": True
+            "retry_on_failure": True,
+            "parse_cache_size": 512,
+            "dedupe_window": 0.5
         },
         "automation": {
             "typing_delay": 0.01,
@@ -82,25 +101,71 @@ class Config:
         Args:
             config_path: Path to YAML configuration file
         """
-        self._config = self.DEFAULT_CONFIG.copy()
+        # Deep copy: _deep_update writes into nested sections
+        self._config = copy.deepcopy(self.DEFAULT_CONFIG)
         self._config_path = Path(config_path) if config_path else None
         
         if self._config_path and self._config_path.exists():
             self._load_from_file()
         else:
             logger.warning(f"Config file not found: {config_path}, using defaults")
+        
+        self._flat = self._flatten(self._config)
+        self._defaults = self._flatten(self.DEFAULT_CONFIG)
     
     def _load_from_file(self):
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file.
+        
+        The parsed YAML is cached in a JSON sidecar next to the file and
+        reused while the file's mtime and size are unchanged.
+        """
         try:
-            with open(self._config_path, 'r') as f:
-                user_config = yaml.safe_load(f)
-                if user_config:
-                    self._deep_update(self._config, user_config)
-                    logger.info(f"Loaded configuration from {self._config_path}")
+            stat = self._config_path.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            
+            user_config = self._load_cache(stamp)
+            if user_config is None:
+                with open(self._config_path, 'r') as f:
+                    user_config = yaml.load(f, Loader=SafeLoader)
+                self._write_cache(stamp, user_config)
+            
+            if user_config:
+                self._deep_update(self._config, user_config)
+                logger.info(f"Loaded configuration from {self._config_path}")
         except Exception as e:
             logger.error(f"Failed to load config file: {e}")
     
+    def _cache_path(self) -> Path:
+        """Path of the JSON sidecar cache for the config file."""
+        return self._config_path.with_name(self._config_path.name + ".cache.json")
+    
+    def _load_cache(self, stamp: list) -> Optional[Dict]:
+        """Return the cached parsed config if it matches ``stamp``."""
+        try:
+            with open(self._cache_path(), 'r') as f:
+                cache = json.load(f)
+            if cache.get("stamp") == stamp:
+                return cache.get("config")
+        except (OSError, ValueError):
+            pass
+        return None
+    
+    def _write_cache(self, stamp: list, user_config: Any):
+        """Write the parsed config to the JSON sidecar (best effort).
+        
+        Configs JSON cannot reproduce exactly (e.g. non-string keys, which
+        come back as strings) are not cached, so every startup sees the
+        same config as the first.
+        """
+        try:
+            if json.loads(json.dumps(user_config)) != user_config:
+                self._cache_path().unlink(missing_ok=True)
+                return
+            with open(self._cache_path(), 'w') as f:
+                json.dump({"stamp": stamp, "config": user_config}, f)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write config cache: {e}")
+    
     def _deep_update(self, base_dict: Dict, update_dict: Dict) -> Dict:
         """Recursively update nested dictionary."""
         for key, value in update_dict.items():
@@ -110,6 +175,16 @@ class Config:
                 base_dict[key] = value
         return base_dict
     
+    def _flatten(self, config: Dict, prefix: str = "") -> Dict[str, Any]:
+        """Index every nested value by its dot-separated key path."""
+        flat = {}
+        for key, value in config.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, f"{path}."))
+        return flat
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation.
         
@@ -120,15 +195,7 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key.split('.')
-        value = self._config
-        
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any):
         """Set configuration value using dot notation.
@@ -144,6 +211,32 @@ class Config:
             config = config.setdefault(k, {})
         
         config[keys[-1]] = value
+        self._flat = self._flatten(self._config)
+    
+    def bind(self, target: Any, spec: Dict[str, str]):
+        """Copy configuration values onto attributes of ``target``.
+        
+        Lets components resolve frequently read settings once at startup
+        instead of calling ``get`` on every use. Missing or null values
+        (e.g. a section left empty in the YAML file) fall back to
+        ``DEFAULT_CONFIG``, and numbers are coerced to the default's type.
+        
+        Args:
+            target: Object to set attributes on
+            spec: Mapping of attribute name to dot-separated key path
+        """
+        for attr, key in spec.items():
+            default = self._defaults.get(key)
+            value = self._flat.get(key)
+            if value is None:
+                value = default
+            elif type(default) in (int, float) and type(value) is not type(default):
+                try:
+                    value = type(default)(value)
+                except (TypeError, ValueError):
+                    logger.warning(f"Invalid value for {key}: {value!r}, using {default!r}")
+                    value = default
+            setattr(target, attr, value)
     
     def save(self, path: Optional[str] = None):
         """Save configuration to file.
@@ -161,7 +254,7 @@ class Config:
             save_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(save_path, 'w') as f:
-                yaml.dump(self._config, f, default_flow_style=False)
+                yaml.dump(self._config, f, Dumper=Dumper, default_flow_style=False)
             
             logger.info(f"Configuration saved to {save_path}")
         except Exception as e:
@@ -0,0 +1,36 @@
+"""
+CTranslate2 compute type selection.
+
+Shared by WhisperEngine and the model download script, which imports it
+directly so that downloading a model does not load torch or openai-whisper.
+"""
+
+import ctranslate2
+
+
+def resolve_compute_type(compute_type: str, device: str) -> str:
+    """Resolve the ``"auto"`` compute type for a device.
+    
+    CTranslate2 reports bfloat16 support only on compute capability 8.0
+    and newer, which is also where int8_float16 runs fastest.
+    
+    Args:
+        compute_type: Configured compute type
+        device: Device the model runs on (cpu, cuda)
+        
+    Returns:
+        int8 on CPU, int8_float16 on Ampere+ GPUs, float16 on older GPUs;
+        any explicit compute type is returned unchanged
+    """
+    if compute_type != "auto":
+        return compute_type
+    
+    if device != "cuda":
+        return "int8"
+    
+    try:
+        supported = ctranslate2.get_supported_compute_types("cuda")
+    except RuntimeError:
+        # No GPU CTranslate2 can use; loading on cuda reports the error
+        return "float16"
+    return "int8_float16" if "bfloat16" in supported else "float16"
@@ -1,16 +1,53 @@
 #!/usr/bin/env python3
 """Download Whisper models."""
 
-import whisper
+import importlib.util
+import os
 from pathlib import Path
 from loguru import logger
 import sys
 
-def download_model(model_name: str = "base"):
+# Parallel range-request downloads; must be set before huggingface_hub is
+# imported, and only when the Rust client is actually installed.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+from faster_whisper import WhisperModel
+from huggingface_hub import snapshot_download
+
+try:
+    from .compute_type import resolve_compute_type
+except ImportError:
+    # Run as a script; importing the core.speech package would load torch
+    from compute_type import resolve_compute_type
+
+# CTranslate2 conversions published for faster-whisper
+MODEL_REPOS = {
+    "tiny": "Systran/faster-whisper-tiny",
+    "base": "Systran/faster-whisper-base",
+    "small": "Systran/faster-whisper-small",
+    "medium": "Systran/faster-whisper-medium",
+    "large": "Systran/faster-whisper-large-v3",
+    "large-v3": "Systran/faster-whisper-large-v3"
+}
+
+# Files WhisperModel needs; skips anything else in the repo
+MODEL_FILES = [
+    "config.json",
+    "preprocessor_config.json",
+    "model.bin",
+    "tokenizer.json",
+    "vocabulary.*"
+]
+
+def download_model(model_name: str = "base", device: str = "cpu", compute_type: str = "auto"):
     """Download Whisper model.
     
     Args:
         model_name: Model size (tiny, base, small, medium, large, large-v3)
+        device: Device the model will run on (cpu, cuda)
+        compute_type: CTranslate2 compute type ("auto" resolves exactly as
+            WhisperEngine does, so the validated type is the one it loads)
     """
     logger.info(f"Downloading Whisper model: {model_name}")
     
@@ -18,8 +55,23 @@ def download_model(model_name: str = "base"):
     models_dir.mkdir(exist_ok=True)
     
     try:
-        model = whisper.load_model(model_name, download_root=str(models_dir))
-        logger.success(f"Model {model_name} downloaded successfully")
+        compute_type = resolve_compute_type(compute_type, device)
+        
+        # Same cache layout WhisperModel(download_root="models") reads from
+        model_path = snapshot_download(
+            repo_id=MODEL_REPOS[model_name],
+            cache_dir=str(models_dir),
+            allow_patterns=MODEL_FILES,
+            max_workers=8
+        )
+        
+        # Load once to validate the download
+        model = WhisperModel(
+            model_path,
+            device=device,
+            compute_type=compute_type
+        )
+        logger.success(f"Model {model_name} downloaded successfully ({compute_type})")
         logger.info(f"Model saved to: {models_dir}")
         return model
     except Exception as e:
@@ -37,6 +89,17 @@ if __name__ == "__main__":
         choices=["tiny", "base", "small", "medium", "large", "large-v3"],
         help="Model size to download"
     )
+    parser.add_argument(
+        "--device",
+        default="cpu",
+        choices=["cuda", "cpu"],
+        help="Device the model will run on"
+    )
+    parser.add_argument(
+        "--compute-type",
+        default="auto",
+        help="CTranslate2 compute type (auto, default, int8, int8_float16, float16, float32)"
+    )
     
     args = parser.parse_args()
-    download_model(args.model)
+    download_model(args.model, device=args.device, compute_type=args.compute_type)
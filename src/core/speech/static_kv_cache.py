@@ -0,0 +1,289 @@
+"""
+Static key/value cache for the openai-whisper text decoder.
+
+openai-whisper grows its decoder cache by concatenation on every token,
+so each step allocates new tensors with a new shape. That rules out CUDA
+graph capture under ``torch.compile(mode="reduce-overhead")``. This module
+swaps in a decoder that writes keys and values into preallocated
+``(batch, n_text_ctx, n_state)`` buffers by position and masks the unused
+tail. Every single-token step then has identical shapes and buffer
+addresses, and can replay one captured graph.
+
+When several clips are decoded together, clips that have finished are
+dropped from the batch instead of being padded with end-of-text tokens
+until the slowest clip completes.
+"""
+
+from typing import List, Optional
+import torch
+import torch.nn.functional as F
+from torch import nn
+import whisper
+import whisper.decoding
+from whisper.decoding import Inference, PyTorchInference
+from whisper.tokenizer import get_tokenizer
+
+# Compact the batch once fewer than this fraction of its clips are still
+# decoding; compacting on every finished clip would capture a new CUDA graph
+# for nearly every batch size
+COMPACT_RATIO = 0.75
+
+
+class StaticKVDecoder(nn.Module):
+    """openai-whisper ``TextDecoder`` with fixed-size key/value buffers.
+    
+    Self-attention buffers hold one row per decoded sequence (clips x
+    beams); cross-attention buffers hold one row per clip and are shared
+    by that clip's beams. Both live in the leading rows of storage sized
+    for the largest batch seen, so every batch size reuses the same
+    addresses.
+    """
+    
+    def __init__(self, decoder: nn.Module):
+        """Wrap a loaded text decoder.
+        
+        Args:
+            decoder: ``model.decoder`` of a loaded Whisper model
+        """
+        super().__init__()
+        self.decoder = decoder
+        self.n_layer = len(decoder.blocks)
+        self.n_ctx, self.n_state = decoder.positional_embedding.shape
+        
+        device = decoder.positional_embedding.device
+        causal = torch.ones(self.n_ctx, self.n_ctx, dtype=torch.bool, device=device).tril()
+        self.register_buffer("causal_mask", causal, persistent=False)
+        
+        self._self_store = torch.empty(2, self.n_layer, 0, self.n_ctx, self.n_state, device=device)
+        self._cross_store = torch.empty(2, self.n_layer, 0, 0, self.n_state, device=device)
+        self._use(0, 0)
+    
+    def _use(self, n_rows: int, n_audio: int):
+        """Point the cache buffers at the leading rows of the storage."""
+        self.register_buffer("k_cache", self._self_store[0, :, :n_rows], persistent=False)
+        self.register_buffer("v_cache", self._self_store[1, :, :n_rows], persistent=False)
+        self.register_buffer("cross_k", self._cross_store[0, :, :n_audio], persistent=False)
+        self.register_buffer("cross_v", self._cross_store[1, :, :n_audio], persistent=False)
+    
+    @torch.no_grad()
+    def prefill(self, n_rows: int, audio_features: torch.Tensor):
+        """Size the buffers for a decode and project the audio features.
+        
+        Storage only grows, so a captured graph keeps pointing at valid
+        memory. Stale entries past the current position are hidden by the
+        causal mask.
+        
+        Args:
+            n_rows: Number of token sequences decoded (clips x beams)
+            audio_features: Encoder output, one row per clip, shape
+                ``(n_clips, n_audio_ctx, n_state)``
+        """
+        dtype, device = audio_features.dtype, audio_features.device
+        n_audio, n_audio_ctx, _ = audio_features.shape
+        
+        if self._self_store.shape[2] < n_rows or self._self_store.dtype != dtype:
+            shape = (2, self.n_layer, n_rows, self.n_ctx, self.n_state)
+            self._self_store = torch.zeros(shape, dtype=dtype, device=device)
+        
+        store = self._cross_store
+        if store.shape[2] < n_audio or store.shape[3] != n_audio_ctx or store.dtype != dtype:
+            shape = (2, self.n_layer, n_audio, n_audio_ctx, self.n_state)
+            self._cross_store = torch.zeros(shape, dtype=dtype, device=device)
+        
+        self._use(n_rows, n_audio)
+        for i, block in enumerate(self.decoder.blocks):
+            self.cross_k[i].copy_(block.cross_attn.key(audio_features))
+            self.cross_v[i].copy_(block.cross_attn.value(audio_features))
+    
+    @torch.no_grad()
+    def reorder(self, source_indices: torch.Tensor):
+        """Reorder cached rows in place after a beam search step."""
+        self.k_cache.copy_(self.k_cache.index_select(1, source_indices))
+        self.v_cache.copy_(self.v_cache.index_select(1, source_indices))
+    
+    @torch.no_grad()
+    def compact(self, keep_audio: torch.Tensor, keep_rows: torch.Tensor):
+        """Move the rows still decoding to the front and shrink the batch.
+        
+        Args:
+            keep_audio: Cross-attention rows (clips) to keep, in order
+            keep_rows: Self-attention rows (sequences) to keep, in order
+        """
+        n_rows, n_audio = len(keep_rows), len(keep_audio)
+        self.k_cache[:, :n_rows] = self.k_cache.index_select(1, keep_rows)
+        self.v_cache[:, :n_rows] = self.v_cache.index_select(1, keep_rows)
+        self.cross_k[:, :n_audio] = self.cross_k.index_select(1, keep_audio)
+        self.cross_v[:, :n_audio] = self.cross_v.index_select(1, keep_audio)
+        self._use(n_rows, n_audio)
+    
+    def forward(self, tokens: torch.Tensor, input_pos: torch.Tensor) -> torch.Tensor:
+        """Run the decoder over ``tokens`` placed at ``input_pos``.
+        
+        Args:
+            tokens: Token ids, shape ``(n_rows, n_tokens)``; each clip's
+                beams are consecutive rows
+            input_pos: Sequence position of each token, shape ``(n_tokens,)``
+            
+        Returns:
+            Float32 logits, shape ``(n_rows, n_tokens, n_vocab)``
+        """
+        decoder = self.decoder
+        x = decoder.token_embedding(tokens) + decoder.positional_embedding[input_pos]
+        x = x.to(self.k_cache.dtype)
+        mask = self.causal_mask[input_pos]
+        
+        n_rows, n_tokens, _ = x.shape
+        n_audio = self.cross_k.shape[1]
+        
+        for i, block in enumerate(decoder.blocks):
+            h = block.attn_ln(x)
+            self.k_cache[i].index_copy_(1, input_pos, block.attn.key(h))
+            self.v_cache[i].index_copy_(1, input_pos, block.attn.value(h))
+            x = x + block.attn.out(_attend(
+                block.attn.n_head, block.attn.query(h), self.k_cache[i], self.v_cache[i], mask
+            ))
+            
+            # Every beam of a clip attends to that clip's audio features
+            q = block.cross_attn.query(block.cross_attn_ln(x)).reshape(n_audio, -1, self.n_state)
+            out = _attend(block.cross_attn.n_head, q, self.cross_k[i], self.cross_v[i])
+            x = x + block.cross_attn.out(out.reshape(n_rows, n_tokens, self.n_state))
+            
+            x = x + block.mlp(block.mlp_ln(x))
+        
+        x = decoder.ln(x)
+        return (x @ decoder.token_embedding.weight.to(x.dtype).T).float()
+
+
+def _attend(n_head: int, q: torch.Tensor, k: torch.Tensor, v: torch.Tensor,
+            mask: Optional[torch.Tensor] = None) -> torch.Tensor:
+    """Multi-head scaled dot-product attention over ``(batch, ctx, n_state)`` inputs."""
+    batch_size, n_query, n_state = q.shape
+    q = q.view(batch_size, n_query, n_head, -1).transpose(1, 2)
+    k = k.view(*k.shape[:2], n_head, -1).transpose(1, 2)
+    v = v.view(*v.shape[:2], n_head, -1).transpose(1, 2)
+    out = F.scaled_dot_product_attention(q, k, v, attn_mask=mask)
+    return out.transpose(1, 2).reshape(batch_size, n_query, n_state)
+
+
+class StaticKVInference(Inference):
+    """``whisper.decoding.Inference`` backed by a :class:`StaticKVDecoder`.
+    
+    Presents ``DecodingTask`` with a fixed batch while decoding only the
+    clips that are still running. Rows of finished clips get logits that
+    force end-of-text, which the greedy decoder already appends to
+    finished sequences without scoring them.
+    """
+    
+    def __init__(self, model: "whisper.Whisper", initial_token_length: int):
+        self.decoder: StaticKVDecoder = model.static_decoder
+        self.step = model.static_decoder_step
+        self.eot: int = model.static_decoder_eot
+        self.initial_token_length = initial_token_length
+        self.prefilled = False
+    
+    def logits(self, tokens: torch.Tensor, audio_features: torch.Tensor) -> torch.Tensor:
+        if not self.prefilled:
+            # The prompt has a variable length; run it eagerly
+            self._start(tokens, audio_features)
+            input_pos = torch.arange(tokens.shape[-1], device=tokens.device)
+            return self.decoder(tokens, input_pos)
+        
+        self._drop_finished(tokens)
+        
+        input_pos = torch.tensor([tokens.shape[-1] - 1], device=tokens.device)
+        last = tokens[self.rows, -1:] if self.compacted else tokens[:, -1:]
+        
+        # Clone out of the graph's static output buffer before the next replay
+        logits = self.step(last, input_pos).clone()
+        if not self.compacted:
+            return logits
+        
+        full = self.eot_logits.clone()
+        full[self.rows] = logits
+        return full
+    
+    def _start(self, tokens: torch.Tensor, audio_features: torch.Tensor):
+        """Prefill the decoder and reset the batch bookkeeping."""
+        n_rows, n_audio = tokens.shape[0], audio_features.shape[0]
+        self.decoder.prefill(n_rows, audio_features)
+        self.prefilled = True
+        
+        self.n_group = n_rows // n_audio
+        self.audio = torch.arange(n_audio, device=tokens.device)
+        self.rows = torch.arange(n_rows, device=tokens.device)
+        # Compact position of each full row, -1 once dropped
+        self.slot = self.rows.clone()
+        self.compacted = False
+        self.eot_logits = None
+    
+    def _drop_finished(self, tokens: torch.Tensor):
+        """Compact the batch once enough clips have finished decoding."""
+        n_audio = len(self.audio)
+        if n_audio < 2:
+            return
+        
+        # A clip is done once every sequence in its group has ended
+        ended = tokens[self.rows, -1] == self.eot
+        done = ended.view(n_audio, self.n_group).all(dim=1)
+        
+        keep = (~done).nonzero().squeeze(1)
+        if len(keep) == 0 or len(keep) >= n_audio * COMPACT_RATIO:
+            return
+        
+        members = torch.arange(self.n_group, device=tokens.device)
+        keep_rows = (keep[:, None] * self.n_group + members).flatten()
+        self.decoder.compact(keep, keep_rows)
+        
+        self.audio = self.audio[keep]
+        self.rows = self.rows[keep_rows]
+        self.slot.fill_(-1)
+        self.slot[self.rows] = torch.arange(len(self.rows), device=tokens.device)
+        
+        if self.eot_logits is None:
+            n_vocab = self.decoder.decoder.token_embedding.num_embeddings
+            self.eot_logits = torch.full((tokens.shape[0], 1, n_vocab), -float("inf"), device=tokens.device)
+            self.eot_logits[:, :, self.eot] = 0
+        self.compacted = True
+    
+    def rearrange_kv_cache(self, source_indices: List[int]):
+        if source_indices != list(range(len(source_indices))):
+            source = torch.tensor(source_indices, device=self.rows.device)
+            # Beams only draw from their own clip, which is kept or dropped
+            # as a whole
+            self.decoder.reorder(self.slot[source[self.rows]])
+    
+    def cleanup_caching(self):
+        # Buffers stay allocated for the next decode
+        self.prefilled = False
+
+
+def _inference_for(model: "whisper.Whisper", initial_token_length: int) -> Inference:
+    """Pick the inference backend for a model inside ``DecodingTask``."""
+    if getattr(model, "static_decoder", None) is not None:
+        return StaticKVInference(model, initial_token_length)
+    return PyTorchInference(model, initial_token_length)
+
+
+def install_static_kv_cache(model: "whisper.Whisper", compile: bool = False) -> StaticKVDecoder:
+    """Route a model's beam search and greedy decoding through a static cache.
+    
+    Args:
+        model: Loaded openai-whisper model
+        compile: Compile the single-token decode step with CUDA graphs
+        
+    Returns:
+        The installed decoder wrapper
+    """
+    model.static_decoder = StaticKVDecoder(model.decoder)
+    model.static_decoder_step = model.static_decoder
+    model.static_decoder_eot = get_tokenizer(
+        model.is_multilingual, num_languages=model.num_languages
+    ).eot
+    if compile:
+        model.static_decoder_step = torch.compile(
+            model.static_decoder, mode="reduce-overhead", fullgraph=True
+        )
+    
+    # DecodingTask looks PyTorchInference up in its module namespace
+    whisper.decoding.PyTorchInference = _inference_for
+    return model.static_decoder
@@ -26,12 +26,19 @@ def setup_logging(config: Config):
     # Remove default handler
     logger.remove()
     
-    # Add console handler
+    # Both sinks write from a background queue so logging never blocks the
+    # audio and transcription threads; backtrace/diagnose are off to skip
+    # frame introspection when exceptions are logged
+    
+    # Add console handler (colored only when stderr is a terminal)
     logger.add(
         sys.stderr,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        format="<green>{time:HH:mm:ss}</green> | <level>{level: <7}</level> | <level>{message}</level>",
         level=log_level,
-        colorize=True
+        colorize=None,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
     
     # Add file handler
@@ -39,8 +46,12 @@ def setup_logging(config: Config):
         log_file,
         rotation="10 MB",
         retention="1 week",
+        compression="gz",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-        level=log_level
+        level=log_level,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False
     )
 
 
@@ -83,6 +94,12 @@ def parse_arguments():
         help="Run only the API server"
     )
     
+    parser.add_argument(
+        "--force-check",
+        action="store_true",
+        help="Re-run all system checks, ignoring cached results"
+    )
+    
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -120,7 +137,7 @@ def main():
         logger.info("Running system checks...")
         system_check = SystemCheck(config)
         
-        if not system_check.run_all_checks():
+        if not system_check.run_all_checks(force=args.force_check):
             logger.error("System checks failed. Please fix the issues and try again.")
             return 1
         
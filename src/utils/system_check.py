@@ -3,8 +3,13 @@ System requirements checker.
 """
 
 import sys
+import json
+import time
 import platform
+import shutil
 import subprocess
+from importlib.metadata import PackageNotFoundError, version
+from importlib.util import find_spec
 from pathlib import Path
 from typing import List, Tuple
 from loguru import logger
@@ -13,6 +18,17 @@ from loguru import logger
 class SystemCheck:
     """System requirements and environment checker."""
     
+    # Passing results of the slow probes are reused across restarts while
+    # the environment key matches, each for its TTL in seconds; devices
+    # come and go more often than packages or drivers change
+    CACHE_FILE = Path("cache/system_check.json")
+    CACHED_CHECKS = {
+        "check_dependencies": 24 * 60 * 60,
+        "check_cuda_availability": 24 * 60 * 60,
+        "check_audio_devices": 60 * 60,
+        "check_disk_space": 24 * 60 * 60
+    }
+    
     def __init__(self, config):
         """Initialize system checker.
         
@@ -42,9 +58,11 @@ class SystemCheck:
         
         required_packages = [
             "whisper",
+            "faster_whisper",
             "torch",
             "PyQt6",
-            "pyaudio",
+            "sounddevice",
+            "soundfile",
             "pyautogui",
             "tree_sitter",
             "fastapi",
@@ -53,11 +71,12 @@ class SystemCheck:
         
         missing = []
         
+        # Locate packages without importing them; importing torch and
+        # whisper alone takes seconds, and the application loads them later
         for package in required_packages:
-            try:
-                __import__(package)
+            if find_spec(package) is not None:
                 logger.debug(f"✓ {package}")
-            except ImportError:
+            else:
                 missing.append(package)
                 logger.warning(f"✗ {package}")
         
@@ -98,19 +117,14 @@ class SystemCheck:
         logger.info("Checking audio devices...")
         
         try:
-            import pyaudio
+            import sounddevice
             
-            p = pyaudio.PyAudio()
-            device_count = p.get_device_count()
-            
-            # Find input devices
-            input_devices = []
-            for i in range(device_count):
-                device_info = p.get_device_info_by_index(i)
-                if device_info['maxInputChannels'] > 0:
-                    input_devices.append(device_info['name'])
-            
-            p.terminate()
+            # One PortAudio enumeration for all host APIs
+            input_devices = [
+                device['name']
+                for device in sounddevice.query_devices()
+                if device['max_input_channels'] > 0
+            ]
             
             if not input_devices:
                 self.errors.append("No audio input devices found")
@@ -131,8 +145,6 @@ class SystemCheck:
         logger.info("Checking disk space...")
         
         try:
-            import shutil
-            
             # Check space in home directory
             home = Path.home()
             stat = shutil.disk_usage(home)
@@ -211,9 +223,53 @@ class SystemCheck:
         logger.success(f"Platform: {system} {platform.release()}")
         return True
     
-    def run_all_checks(self) -> bool:
+    def _environment_key(self) -> list:
+        """Key identifying the environment the cached results belong to."""
+        try:
+            torch_version = version("torch")
+        except PackageNotFoundError:
+            torch_version = None
+        
+        return [
+            platform.node(),
+            platform.release(),
+            platform.python_version(),
+            torch_version,
+            self.config.get("whisper.model", "base")
+        ]
+    
+    def _load_cache(self, key: list) -> dict:
+        """Return cached passing checks that match ``key`` and are fresh."""
+        try:
+            with open(self.CACHE_FILE, 'r') as f:
+                cache = json.load(f)
+            if cache.get("key") != key:
+                return {}
+            
+            now = time.time()
+            return {
+                name: entry
+                for name, entry in cache.get("checks", {}).items()
+                if now - entry["time"] < self.CACHED_CHECKS.get(name, 0)
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+    
+    def _write_cache(self, key: list, checks: dict):
+        """Persist passing check results (best effort)."""
+        try:
+            self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.CACHE_FILE, 'w') as f:
+                json.dump({"key": key, "checks": checks}, f)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write system check cache: {e}")
+    
+    def run_all_checks(self, force: bool = False) -> bool:
         """Run all system checks.
         
+        Args:
+            force: Re-run every probe even if cached results are fresh
+        
         Returns:
             True if all checks pass
         """
@@ -227,14 +283,38 @@ class SystemCheck:
             self.check_permissions
         ]
         
+        key = self._environment_key()
+        cached = {} if force else self._load_cache(key)
+        passed = {}
         results = []
         
         for check in checks:
+            name = check.__name__
+            
+            if name in cached:
+                # Replay warnings so the summary matches a full run
+                self.warnings.extend(cached[name]["warnings"])
+                passed[name] = cached[name]
+                logger.debug(f"{name}: cached")
+                results.append(True)
+                continue
+            
+            warnings_before = len(self.warnings)
             try:
-                results.append(check())
+                result = check()
             except Exception as e:
-                logger.error(f"Check failed: {check.__name__}: {e}")
-                results.append(False)
+                logger.error(f"Check failed: {name}: {e}")
+                result = False
+            results.append(result)
+            
+            if result and name in self.CACHED_CHECKS:
+                passed[name] = {
+                    "time": time.time(),
+                    "warnings": self.warnings[warnings_before:]
+                }
+        
+        if passed != cached:
+            self._write_cache(key, passed)
         
         # Display summary
         logger.info("\n" + "="*60)
@@ -0,0 +1,7 @@
+"""Shared test configuration."""
+
+import sys
+from pathlib import Path
+
+# Import application modules the way src/main.py does
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
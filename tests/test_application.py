@@ -0,0 +1,150 @@
+"""Tests for the application's transcription batching and shutdown."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from core.application import Application
+from core.config import Config
+
+
+class FakeEngine:
+    """Engine stub: durations from a lookup, texts echo the input."""
+    
+    def __init__(self, fail_batches: bool = False):
+        self.fail_batches = fail_batches
+        self.batches = []
+    
+    def audio_duration(self, audio_data):
+        if audio_data == b"bad":
+            raise ValueError("Not a RIFF/WAVE buffer")
+        return 1.0
+    
+    async def transcribe_batch(self, audio_batch):
+        self.batches.append(list(audio_batch))
+        if self.fail_batches:
+            raise RuntimeError("model crashed")
+        return [audio.decode() for audio in audio_batch]
+
+
+def make_app(engine: FakeEngine) -> Application:
+    app = Application(Config(), headless=True)
+    app.whisper_engine = engine
+    return app
+
+
+def test_unreadable_clip_fails_alone():
+    engine = FakeEngine()
+    app = make_app(engine)
+    
+    async def scenario():
+        results = await asyncio.gather(
+            app._handle_audio_ready(b"good"),
+            app._handle_audio_ready(b"bad"),
+            app._handle_audio_ready(b"also good")
+        )
+        worker_alive = not app._batch_task.done()
+        app._batch_task.cancel()
+        return results, worker_alive
+    
+    _, worker_alive = asyncio.run(asyncio.wait_for(scenario(), 5))
+    
+    assert worker_alive
+    assert engine.batches == [[b"good", b"also good"]]
+
+
+def test_worker_exit_fails_outstanding_requests():
+    app = make_app(FakeEngine())
+    app.batch_size = 1
+    
+    async def crash(batch):
+        raise RuntimeError("worker bug")
+    
+    app._transcribe_batch = crash
+    
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in range(3)]
+        app._audio_queue = asyncio.Queue()
+        for future in futures:
+            app._audio_queue.put_nowait((b"clip", 0, future))
+        app._batch_task = loop.create_task(app._batch_worker())
+        
+        await asyncio.gather(app._batch_task, return_exceptions=True)
+        return [future.exception() for future in futures]
+    
+    errors = asyncio.run(asyncio.wait_for(scenario(), 5))
+    
+    assert all(isinstance(error, RuntimeError) for error in errors)
+
+
+def test_cancelled_worker_cancels_outstanding_requests():
+    app = make_app(FakeEngine())
+    
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        app._audio_queue = asyncio.Queue()
+        app._batch_task = loop.create_task(app._batch_worker())
+        # Land in the 30 s bucket, which waits longest before flushing
+        await app._audio_queue.put((b"clip", 3, future))
+        await asyncio.sleep(0)
+        app._batch_task.cancel()
+        await asyncio.gather(app._batch_task, return_exceptions=True)
+        return future
+    
+    assert asyncio.run(scenario()).cancelled()
+
+
+class FakeComponent:
+    """Audio/automation stub that records the shutdown calls it gets."""
+    
+    def __init__(self, app: Application):
+        self.app = app
+        self.calls = []
+    
+    def start(self):
+        # Deliver one utterance, then stop the loop as Ctrl+C would
+        loop = self.app.loop
+        loop.create_task(self.app._handle_audio_ready(b"clip"))
+        loop.call_later(0.01, loop.stop)
+    
+    def stop(self):
+        self.calls.append("stop")
+    
+    def cleanup(self):
+        self.calls.append("cleanup")
+
+
+def test_headless_cleanup_after_audio_shuts_down_components():
+    engine = FakeEngine()
+    engine.cleanup = lambda: engine.batches.append("cleanup")
+    app = make_app(engine)
+    app.audio_manager = FakeComponent(app)
+    app.automation_manager = FakeComponent(app)
+    
+    assert app._run_headless_mode() == 0
+    assert app._batch_task is not None
+    app.cleanup()
+    
+    assert app.audio_manager.calls == ["stop"]
+    assert app.automation_manager.calls == ["cleanup"]
+    assert engine.batches[-1] == "cleanup"
+
+
+def test_audio_stops_before_engine_and_automation_shut_down():
+    events = []
+    
+    def stop_audio():
+        time.sleep(0.05)
+        events.append("audio stopped")
+    
+    app = make_app(FakeEngine())
+    app.audio_manager = SimpleNamespace(stop=stop_audio)
+    app.whisper_engine.cleanup = lambda: events.append("engine cleaned up")
+    app.automation_manager = SimpleNamespace(cleanup=lambda: events.append("automation cleaned up"))
+    
+    asyncio.run(app._shutdown_components())
+    
+    assert events[0] == "audio stopped"
+    assert sorted(events[1:]) == ["automation cleaned up", "engine cleaned up"]
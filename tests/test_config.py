@@ -0,0 +1,64 @@
+"""Tests for configuration loading."""
+
+from types import SimpleNamespace
+
+from core.config import Config
+
+
+def test_cached_config_matches_first_load(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("commands:\n  aliases:\n    1: first\n    two: second\n")
+    
+    first = Config(str(path)).get("commands.aliases")
+    second = Config(str(path)).get("commands.aliases")
+    
+    assert first == {1: "first", "two": "second"}
+    assert second == first
+    assert not (tmp_path / "config.yml.cache.json").exists()
+
+
+def test_json_safe_config_is_cached(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("whisper:\n  model: tiny\n")
+    
+    Config(str(path))
+    
+    assert (tmp_path / "config.yml.cache.json").exists()
+    assert Config(str(path)).get("whisper.model") == "tiny"
+
+
+def test_loading_a_file_leaves_defaults_untouched(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("whisper:\n  model: tiny\n")
+    
+    Config(str(path))
+    
+    assert Config().get("whisper.model") == "base"
+    assert Config.DEFAULT_CONFIG["whisper"]["model"] == "base"
+
+
+def test_bind_falls_back_to_defaults_for_empty_sections(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("whisper:\n  # model: tiny\n")
+    target = SimpleNamespace()
+    
+    Config(str(path)).bind(target, {"backend": "whisper.backend", "batch_size": "whisper.batch_size"})
+    
+    assert target.backend == "faster_whisper"
+    assert target.batch_size == 8
+
+
+def test_bind_coerces_numbers_to_the_default_type(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("whisper:\n  beam_size: '3'\n  temperature: 0\n  best_of: many\n")
+    target = SimpleNamespace()
+    
+    Config(str(path)).bind(target, {
+        "beam_size": "whisper.beam_size",
+        "temperature": "whisper.temperature",
+        "best_of": "whisper.best_of"
+    })
+    
+    assert target.beam_size == 3
+    assert target.temperature == 0.0 and isinstance(target.temperature, float)
+    assert target.best_of == 5
@@ -0,0 +1,53 @@
+"""Tests for the model download script."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import ctranslate2
+import pytest
+
+from core.speech import download_model
+from core.speech.compute_type import resolve_compute_type
+
+SCRIPT = Path(download_model.__file__)
+
+
+def _cuda_types(types):
+    def get_supported_compute_types(device):
+        if types is None:
+            raise RuntimeError("CUDA driver version is insufficient for CUDA runtime version")
+        return types
+    return get_supported_compute_types
+
+
+@pytest.mark.parametrize("types, expected", [
+    ({"float32", "float16", "int8", "int8_float16"}, "float16"),
+    ({"float32", "float16", "bfloat16", "int8", "int8_float16", "int8_bfloat16"}, "int8_float16"),
+    (None, "float16")
+], ids=["sm75", "sm86", "no-cuda"])
+def test_auto_compute_type_matches_engine(monkeypatch, tmp_path, types, expected):
+    loaded = {}
+    
+    def fake_model(path, device, compute_type):
+        loaded["compute_type"] = compute_type
+    
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(ctranslate2, "get_supported_compute_types", _cuda_types(types))
+    monkeypatch.setattr(download_model, "snapshot_download", lambda **kwargs: str(tmp_path))
+    monkeypatch.setattr(download_model, "WhisperModel", fake_model)
+    
+    download_model.download_model("tiny", device="cuda")
+    
+    assert loaded["compute_type"] == expected == resolve_compute_type("auto", "cuda")
+
+
+def test_script_does_not_import_torch():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(SCRIPT), "--help"],
+        capture_output=True, text=True, check=True
+    )
+    imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+    
+    assert "compute_type" in imported
+    assert not {"torch", "whisper"} & imported
@@ -0,0 +1,117 @@
+"""Tests for the static KV cache decoder against upstream openai-whisper."""
+
+import numpy as np
+import pytest
+import torch
+import whisper
+import whisper.decoding
+from whisper.model import ModelDimensions, Whisper
+
+from core.speech.static_kv_cache import StaticKVDecoder, install_static_kv_cache
+
+# Smallest model the multilingual tokenizer works with
+TINY_DIMS = ModelDimensions(
+    n_mels=80,
+    n_audio_ctx=1500,
+    n_audio_state=64,
+    n_audio_head=4,
+    n_audio_layer=2,
+    n_vocab=51865,
+    n_text_ctx=448,
+    n_text_state=64,
+    n_text_head=4,
+    n_text_layer=2
+)
+
+
+@pytest.fixture
+def model(monkeypatch):
+    """Random tiny Whisper with the static cache installed but switched off."""
+    # install_static_kv_cache patches this module attribute process-wide
+    monkeypatch.setattr(whisper.decoding, "PyTorchInference", whisper.decoding.PyTorchInference)
+    torch.manual_seed(0)
+    model = Whisper(TINY_DIMS).eval()
+    # Upstream allocates this with torch.empty and relies on the checkpoint
+    torch.nn.init.normal_(model.decoder.positional_embedding, std=0.02)
+    model.installed_decoder = install_static_kv_cache(model)
+    model.static_decoder = None
+    return model
+
+
+def run(model, static: bool, fn):
+    """Call ``fn`` with the static cache on or off."""
+    model.static_decoder = model.installed_decoder if static else None
+    try:
+        return fn()
+    finally:
+        model.static_decoder = None
+
+
+def test_greedy_batch_matches_upstream(model):
+    mel = torch.randn(3, 80, 3000)
+    options = whisper.DecodingOptions(language="en", fp16=False, sample_len=20)
+    
+    expected = run(model, False, lambda: whisper.decode(model, mel, options))
+    actual = run(model, True, lambda: whisper.decode(model, mel, options))
+    
+    assert [result.tokens for result in actual] == [result.tokens for result in expected]
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_beam_search_matches_upstream(model, seed):
+    torch.manual_seed(seed)
+    mel = torch.randn(1, 80, 3000)
+    options = whisper.DecodingOptions(language="en", fp16=False, beam_size=3, sample_len=20)
+    
+    expected = run(model, False, lambda: whisper.decode(model, mel, options))[0]
+    actual = run(model, True, lambda: whisper.decode(model, mel, options))[0]
+    
+    assert actual.tokens == expected.tokens
+    assert actual.avg_logprob == pytest.approx(expected.avg_logprob, abs=1e-4)
+
+
+def test_transcribe_matches_upstream(model):
+    audio = np.random.default_rng(0).standard_normal(16000 * 40).astype(np.float32) * 0.1
+    
+    def transcribe():
+        result = model.transcribe(audio, language="en", fp16=False, beam_size=3, temperature=0.0)
+        return [segment["tokens"] for segment in result["segments"]]
+    
+    assert run(model, True, transcribe) == run(model, False, transcribe)
+
+
+@pytest.mark.parametrize("without_timestamps", [True, False])
+def test_finished_clips_are_dropped_without_changing_tokens(model, monkeypatch, without_timestamps):
+    # Force each clip to end after a different number of tokens
+    lengths = [6, 9, 12, 14, 30, 45, 50, 70]
+    update = whisper.decoding.GreedyDecoder.update
+    
+    def staggered_update(self, tokens, logits, sum_logprobs):
+        tokens, _ = update(self, tokens, logits, sum_logprobs)
+        for row, length in enumerate(lengths):
+            if tokens.shape[-1] == length or (tokens.shape[-1] > length and tokens[row, -2] == self.eot):
+                tokens[row, -1] = self.eot
+        return tokens, (tokens[:, -1] == self.eot).all()
+    
+    monkeypatch.setattr(whisper.decoding.GreedyDecoder, "update", staggered_update)
+    
+    compactions = []
+    compact = StaticKVDecoder.compact
+    
+    def spy(self, keep_audio, keep_rows):
+        compactions.append(len(keep_audio))
+        return compact(self, keep_audio, keep_rows)
+    
+    monkeypatch.setattr(StaticKVDecoder, "compact", spy)
+    
+    mel = torch.randn(len(lengths), 80, 3000)
+    options = whisper.DecodingOptions(
+        language="en", fp16=False, sample_len=100, without_timestamps=without_timestamps
+    )
+    
+    expected = run(model, False, lambda: whisper.decode(model, mel, options))
+    actual = run(model, True, lambda: whisper.decode(model, mel, options))
+    
+    assert [result.tokens for result in actual] == [result.tokens for result in expected]
+    assert compactions and compactions == sorted(compactions, reverse=True)
+    assert compactions[-1] < len(lengths)
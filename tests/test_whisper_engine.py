@@ -0,0 +1,196 @@
+"""Tests for the Whisper engine's audio handling and batching."""
+
+import io
+import logging
+import struct
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import soundfile
+from faster_whisper import BatchedInferencePipeline
+
+from core.speech import whisper_engine
+from core.speech.whisper_engine import WhisperEngine, _parse_wav_header
+
+
+def make_engine(**attrs) -> WhisperEngine:
+    """Engine with the attributes the tested paths read and no model."""
+    engine = WhisperEngine.__new__(WhisperEngine)
+    engine._scratch = threading.local()
+    engine.sample_rate = 16000
+    engine.language = "en"
+    engine.batch_size = 8
+    engine._decode_opts = {"language": "en", "beam_size": 5, "best_of": 5, "temperature": 0.0}
+    for name, value in attrs.items():
+        setattr(engine, name, value)
+    return engine
+
+
+class _Encoding:
+    ids = [1]
+
+
+class _HFTokenizer:
+    def encode(self, text, add_special_tokens=False):
+        return _Encoding()
+    
+    def token_to_id(self, token):
+        return 1
+
+
+class _PeakFeatures:
+    """Feature extractor whose features carry the chunk's peak amplitude."""
+    sampling_rate = 16000
+    chunk_length = 30
+    
+    def __call__(self, chunk):
+        peak = np.abs(chunk).max() if len(chunk) else 0.0
+        return np.full((80, 3001), peak, dtype=np.float32)
+
+
+class _PeakPipeline(BatchedInferencePipeline):
+    """Real pipeline that decodes each chunk to text naming its peak.
+    
+    Clip timestamp handling and chunking run unchanged, so text ends up on
+    the wrong clip if the pipeline joins or misplaces clips.
+    """
+    
+    def __init__(self):
+        model = SimpleNamespace(
+            feature_extractor=_PeakFeatures(),
+            logger=logging.getLogger("faster_whisper"),
+            frames_per_second=50,
+            hf_tokenizer=_HFTokenizer(),
+            model=SimpleNamespace(is_multilingual=False, n_mels=80)
+        )
+        super().__init__(model=model)
+    
+    def forward(self, features, tokenizer, chunks_metadata, options):
+        outputs = []
+        for feature, metadata in zip(features, chunks_metadata):
+            offset = metadata.get("offset", metadata.get("start_time"))
+            outputs.append([{
+                "text": f" peak{feature.max():.1f}",
+                "avg_logprob": 0.0,
+                "no_speech_prob": 0.1,
+                "tokens": [1],
+                "start": offset,
+                "end": offset + 1,
+                "compression_ratio": 1.0,
+                "seek": 0
+            }])
+        return outputs
+
+
+def _energy_vad(audio, options):
+    """Stand-in for Silero: one span over samples above -40 dBFS."""
+    voiced = np.flatnonzero(np.abs(audio) > 0.01)
+    if not len(voiced):
+        return []
+    return [{"start": int(voiced[0]), "end": int(voiced[-1]) + 1}]
+
+
+def _tone(peak: float, length: int, lead: int = 0) -> np.ndarray:
+    clip = np.zeros(length, dtype=np.float32)
+    clip[lead:lead + length // 2] = peak * np.sin(np.arange(length // 2))
+    clip[lead] = peak
+    return clip
+
+
+@pytest.fixture
+def faster_engine(monkeypatch):
+    monkeypatch.setattr(whisper_engine, "get_speech_timestamps", _energy_vad)
+    return make_engine(backend="faster_whisper", batched_model=_PeakPipeline())
+
+
+def test_batched_clips_get_one_result_each(faster_engine):
+    clips = [_tone(0.3, 16123, lead=500), _tone(0.5, 24007), _tone(0.7, 12345, lead=100)]
+    
+    results = faster_engine._transcribe_many_faster_whisper(clips)
+    if results is None:
+        # faster-whisper 1.2.0 joins clips, so the batch goes clip by clip
+        assert whisper_engine.CLIP_TIMESTAMPS_MERGED
+        return
+    
+    assert [result["text"] for result in results] == [" peak0.3", " peak0.5", " peak0.7"]
+    assert all(len(result["segments"]) == 1 for result in results)
+
+
+def test_silent_clip_is_skipped_alone_and_in_a_batch(faster_engine):
+    silence = np.zeros(8000, dtype=np.float32)
+    
+    alone = faster_engine._transcribe_faster_whisper(silence)
+    batched = faster_engine._decode_clips_faster_whisper([silence, _tone(0.5, 16000)])
+    
+    assert alone["text"] == "" and alone["segments"] == []
+    if batched is not None:
+        assert batched[0]["text"] == "" and batched[0]["segments"] == []
+        assert batched[1]["text"] == " peak0.5"
+
+
+def _wav_header(channels: int = 1, sample_rate: int = 16000, bits: int = 16, fmt_size: int = 16) -> bytes:
+    fmt = struct.pack('<HHIIHH', 1, channels, sample_rate, sample_rate * channels * bits // 8, channels * bits // 8, bits)
+    return b'RIFF' + struct.pack('<I', 36) + b'WAVE' + b'fmt ' + struct.pack('<I', fmt_size) + fmt[:fmt_size]
+
+
+def test_wav_header_is_parsed():
+    audio_bytes = _wav_header(channels=2) + b'data' + struct.pack('<I', 8) + bytes(8)
+    
+    assert _parse_wav_header(audio_bytes) == (16000, 2, 2, 44, 8)
+
+
+@pytest.mark.parametrize("audio_bytes", [
+    b'RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00',
+    _wav_header(fmt_size=8) + b'data' + struct.pack('<I', 2) + bytes(2),
+    _wav_header(channels=0) + b'data' + struct.pack('<I', 2) + bytes(2),
+    _wav_header(sample_rate=0) + b'data' + struct.pack('<I', 2) + bytes(2),
+    _wav_header(),
+    b'not a wav file',
+], ids=["truncated-fmt", "short-fmt", "no-channels", "no-sample-rate", "no-data", "not-riff"])
+def test_malformed_wav_header_raises_value_error(audio_bytes):
+    with pytest.raises(ValueError):
+        _parse_wav_header(audio_bytes)
+
+
+@pytest.mark.parametrize("subtype", ["PCM_16", "PCM_24"])
+@pytest.mark.parametrize("channels", [1, 2, 3])
+def test_pcm_wav_decodes_like_soundfile(subtype, channels):
+    rng = np.random.default_rng(channels)
+    samples = rng.uniform(-1.0, 1.0, (16000, channels))
+    buffer = io.BytesIO()
+    soundfile.write(buffer, samples, 16000, subtype=subtype, format="WAV")
+    audio_bytes = buffer.getvalue()
+    
+    expected, _ = soundfile.read(io.BytesIO(audio_bytes), dtype="float32", always_2d=True)
+    expected = expected.mean(axis=1)
+    engine = make_engine()
+    engine._decode_audio = None  # must take the direct PCM path
+    audio = engine._load_audio_from_bytes(audio_bytes)
+    
+    assert audio.dtype == np.float32
+    np.testing.assert_array_equal(audio, expected)
+
+
+@pytest.mark.parametrize("view", [
+    memoryview(np.array([16384, -8192, 0, 32767], dtype=np.int16)),
+    memoryview(np.array([16384, -8192, 0, 32767], dtype=np.int16).tobytes()),
+    memoryview(np.array([0.5, -0.25, 0.0, 32767 / 32768], dtype=np.float32)),
+], ids=["int16", "bytes", "float32"])
+def test_pcm_memoryview_keeps_its_sample_type(view):
+    engine = make_engine()
+    
+    assert engine.audio_duration(view) == 4 / 16000
+    np.testing.assert_array_equal(
+        engine._load_audio(view), np.array([0.5, -0.25, 0.0, 32767 / 32768], dtype=np.float32)
+    )
+
+
+def test_pcm_memoryview_of_other_type_is_rejected():
+    view = memoryview(np.zeros(4, dtype=np.float64))
+    
+    with pytest.raises(ValueError):
+        make_engine().audio_duration(view)
+    with pytest.raises(ValueError):
+        make_engine()._load_audio(view)